@@ -0,0 +1,30 @@
+"""
+Shared table list for the database cleanup scripts in this directory.
+
+Usage:
+    from _cleanup_tables import DELETE_STATEMENTS
+    for statement, label in DELETE_STATEMENTS:
+        db.execute(statement)
+"""
+from sqlalchemy import text
+
+from app.models.models import (
+    Workspace, User, Team, Policy, Assignment,
+    Acknowledgment, EmailEvent, AuthCode, Notification
+)
+
+# Tables in the order they must be cleared (dependents before the tables they reference)
+DELETE_ORDER = [
+    (Notification, "notifications"),
+    (Acknowledgment, "acknowledgments"),
+    (EmailEvent, "email events"),
+    (Assignment, "assignments"),
+    (Policy, "policies"),
+    (AuthCode, "auth codes"),
+    (User, "users"),
+    (Team, "teams"),
+    (Workspace, "workspaces"),
+]
+
+# Plain DELETE statements, built once so they skip ORM compilation
+DELETE_STATEMENTS = [(text(f"DELETE FROM {model.__tablename__}"), label) for model, label in DELETE_ORDER]
@@ -0,0 +1,28 @@
+"""
+Shared stdout logging for the maintenance scripts in this directory.
+
+Usage:
+    from _script_logging import get_logger
+    logger = get_logger("archive")
+    logger.info("...")
+"""
+import logging
+import logging.handlers
+import sys
+
+
+def get_logger(name, capacity=100):
+    """
+    Return a logger that prints bare messages to stdout.
+
+    Lines are buffered and written in batches of `capacity`; an ERROR flushes
+    the buffer immediately, and anything left is flushed at interpreter exit.
+    """
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logger = logging.getLogger(name)
+    logger.addHandler(logging.handlers.MemoryHandler(capacity, flushLevel=logging.ERROR, target=stdout_handler))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
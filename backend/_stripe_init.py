@@ -0,0 +1,94 @@
+"""
+Shared Stripe setup for the maintenance scripts in this directory.
+
+Usage:
+    from _stripe_init import init, get_client, fetch_subscriptions
+    stripe = init()
+    client = get_client()  # StripeClient for thread-pooled or high-volume calls
+    lookups = fetch_subscriptions(client, workspaces)  # subscription ID -> Future
+"""
+import atexit
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+import stripe
+from dotenv import load_dotenv
+
+from app.core.stripe_http import STRIPE_MAX_NETWORK_RETRIES, configure_stripe_http_client
+
+
+@lru_cache(maxsize=1)
+def init():
+    """Load .env, set the Stripe API key and install the pooled HTTP client, once per process."""
+    load_dotenv()
+
+    api_key = os.getenv('STRIPE_SECRET_KEY')
+    if not api_key:
+        # Only build the full app settings when the key isn't in the environment
+        from app.core.config import settings
+        api_key = settings.stripe_secret_key
+    stripe.api_key = api_key
+
+    session = configure_stripe_http_client(pool_maxsize=16)
+    atexit.register(session.close)
+
+    return stripe
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Return a StripeClient on init()'s API key and pooled HTTP client, with its own network retries."""
+    init()
+    return stripe.StripeClient(
+        stripe.api_key,
+        http_client=stripe.default_http_client,
+        max_network_retries=STRIPE_MAX_NETWORK_RETRIES,
+    )
+
+
+# Statuses Stripe never moves out of, so the database value can be trusted without a lookup
+TERMINAL_STATUSES = {'canceled', 'incomplete_expired'}
+
+# Separator for the subscription check reports
+SEP = "=" * 80
+
+
+def fetch_subscriptions(client, workspaces):
+    """
+    Look up the Stripe subscription of every workspace not terminal in the database.
+
+    Subscriptions are listed 100 per request, stopping once all are found; any the
+    list didn't return are retrieved concurrently. Returns a Future per subscription
+    ID, so a failed lookup raises from .result() for that workspace only.
+    """
+    wanted = {
+        ws.stripe_subscription_id for ws in workspaces
+        if ws.subscription_status not in TERMINAL_STATUSES
+    }
+    lookups = {}
+    if wanted:
+        for sub in client.subscriptions.list(params={'limit': 100, 'status': 'all'}).auto_paging_iter():
+            if sub.id in wanted:
+                lookups[sub.id] = Future()
+                lookups[sub.id].set_result(sub)
+                if len(lookups) == len(wanted):
+                    break
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for sub_id in wanted - lookups.keys():
+            lookups[sub_id] = executor.submit(client.subscriptions.retrieve, sub_id)
+
+    return lookups
+
+
+def workspace_lines(ws):
+    """Return the report header lines for a workspace, ending with a skip line if it needs no lookup."""
+    lines = [
+        f"🏢 Workspace: {ws.name}",
+        f"   Customer ID: {ws.stripe_customer_id}",
+        f"   Subscription ID: {ws.stripe_subscription_id}",
+    ]
+    if ws.subscription_status in TERMINAL_STATUSES:
+        lines.append(f"   ⏭️  Skipped (plan={ws.plan.value}, status={ws.subscription_status} in database)")
+    return lines
@@ -0,0 +1,24 @@
+"""
+Shared Stripe product helpers for the maintenance scripts in this directory.
+
+Usage:
+    from _stripe_products import needs_update
+    if needs_update(product, {'description': ..., 'metadata': {...}}):
+        stripe.Product.modify(product_id, ...)
+"""
+
+
+def needs_update(product, desired):
+    """Check whether a product differs from the desired fields (metadata keys are merged by Stripe)."""
+    if product is None:
+        return True
+
+    for field, value in desired.items():
+        if field == 'metadata':
+            current = product.metadata or {}
+            if any(current.get(key) != val for key, val in value.items()):
+                return True
+        elif getattr(product, field, None) != value:
+            return True
+
+    return False
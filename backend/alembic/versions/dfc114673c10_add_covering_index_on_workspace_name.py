@@ -0,0 +1,31 @@
+"""add_covering_index_on_workspace_name
+
+Revision ID: dfc114673c10
+Revises: a9899820fa27
+Create Date: 2026-10-17 10:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'dfc114673c10'
+down_revision = 'a9899820fa27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Name lookups are already covered by uix_workspace_name; this index also carries
+    # id and is_whitelisted so the whitelist script's workspace listing is index-only
+    op.create_index(
+        'ix_workspaces_name_covering',
+        'workspaces',
+        ['name'],
+        postgresql_include=['id', 'is_whitelisted'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workspaces_name_covering', table_name='workspaces')
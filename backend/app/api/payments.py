@@ -251,24 +251,15 @@ def update_subscription(
             )
             workspace.staff_count = request.new_staff_count  # Update licensed seats
 
-        # Handle SSO recurring add-on toggle
+        # Handle SSO toggle
         if request.enable_sso and not workspace.sso_enabled:
             if not workspace.stripe_subscription_id:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="No active subscription to modify"
                 )
-            try:
-                interval = (workspace.billing_interval or "monthly").replace("monthly", "month").replace("annual", "year")
-                sso_price_id = StripeService.create_or_get_sso_recurring_price_id(interval)
-                stripe.SubscriptionItem.create(
-                    subscription=workspace.stripe_subscription_id,
-                    price=sso_price_id,
-                    quantity=1,
-                )
-                workspace.sso_enabled = True
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Failed to enable SSO add-on: {str(e)}")
+            # SSO is included in every flat-rate plan, so there is no add-on price to attach
+            workspace.sso_enabled = True
 
         if request.disable_sso and workspace.sso_enabled:
             if not workspace.stripe_subscription_id:
@@ -278,11 +269,13 @@ def update_subscription(
                 )
             try:
                 # Find and remove the SSO item from the subscription
-                subscription = StripeService.get_subscription(workspace.stripe_subscription_id)
+                # Expand price products up front instead of fetching each item's price and product
+                subscription = StripeService.get_subscription(
+                    workspace.stripe_subscription_id,
+                    expand=["items.data.price.product"],
+                )
                 for item in subscription["items"]["data"]:
-                    price = stripe.Price.retrieve(item.price.id)
-                    product = stripe.Product.retrieve(price.product)
-                    if product.name == "SSO Add-on":
+                    if item.price.product.name == "SSO Add-on":
                         stripe.SubscriptionItem.delete(item.id)
                         break
                 workspace.sso_enabled = False
@@ -1,13 +1,13 @@
 """
 Webhook endpoints for Stripe events.
 """
-from fastapi import APIRouter, Request, HTTPException, Depends, status
+from fastapi import APIRouter, Request, HTTPException, BackgroundTasks, status
 from sqlalchemy.orm import Session
 from datetime import datetime
 from uuid import UUID
 import logging
 
-from ..models.database import get_db
+from ..models.database import SessionLocal
 from ..models.models import Workspace, PlanTier
 from ..services.stripe_service import StripeService
 
@@ -17,10 +17,13 @@ router = APIRouter()
 
 
 @router.post("/stripe")
-async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
+async def stripe_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Handle Stripe webhook events.
 
+    The event is verified inline and acknowledged immediately; the actual
+    processing runs as a background task so Stripe never times out and retries.
+
     Important events to handle:
     - checkout.session.completed: When payment is successful
     - customer.subscription.created: When subscription is created
@@ -53,7 +56,24 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
 
         logger.info(f"Received Stripe webhook event: {event.type}")
 
-        # Handle different event types
+        background_tasks.add_task(process_webhook_event, event)
+
+        return {"received": True}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing webhook: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to process webhook"
+        )
+
+
+def process_webhook_event(event):
+    """Dispatch a verified Stripe event to its handler with a dedicated DB session."""
+    db = SessionLocal()
+    try:
         if event.type == "checkout.session.completed":
             handle_checkout_completed(event.data.object, db)
 
@@ -78,16 +98,10 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
         else:
             logger.info(f"Unhandled event type: {event.type}")
 
-        return {"received": True}
-
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Error processing webhook: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process webhook"
-        )
+        logger.error(f"Error processing webhook event {event.id}: {str(e)}")
+    finally:
+        db.close()
 
 
 def handle_checkout_completed(session, db: Session):
@@ -17,6 +17,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = ""
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 300  # seconds; recycle before server/pgbouncer idle timeouts
 
     # URLs
     frontend_url: str = "http://localhost:5173"
@@ -0,0 +1,51 @@
+import logging
+
+import requests
+import stripe
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Stripe retries failed requests itself and attaches idempotency keys to
+# retried POSTs, so retries are left to the SDK rather than the adapter.
+# Pass this to the StripeClients that want retries; the global
+# stripe.max_network_retries is left untouched.
+STRIPE_MAX_NETWORK_RETRIES = 3
+
+
+def build_stripe_session(pool_maxsize: int = 50) -> requests.Session:
+    """
+    Build a keep-alive requests session with a connection pool sized for Stripe calls.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections to api.stripe.com
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    return session
+
+
+def configure_stripe_http_client(pool_maxsize: int = 50) -> requests.Session:
+    """
+    Route all Stripe SDK calls through one shared, connection-pooled session.
+
+    After the first request, later calls reuse the open TLS connection
+    instead of paying a new handshake.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections to api.stripe.com
+
+    Returns:
+        The session backing the Stripe client, so callers can close it
+    """
+    session = build_stripe_session(pool_maxsize)
+    stripe.default_http_client = stripe.RequestsClient(
+        session=session,
+        verify_ssl_certs=True,
+    )
+    logger.debug(f"Configured pooled Stripe HTTP client (pool_maxsize={pool_maxsize})")
+    return session
@@ -14,7 +14,18 @@ try:
     else:
         database_url = settings.database_url
 
-    engine = create_engine(database_url)
+    if database_url.startswith("sqlite"):
+        engine = create_engine(database_url)
+    else:
+        # Pooled connections, checked before use so a dropped connection is replaced
+        # transparently instead of failing the first query after an idle period
+        engine = create_engine(
+            database_url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=settings.db_pool_recycle,
+        )
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     logger.info(f"Database engine created successfully")
 except Exception as e:
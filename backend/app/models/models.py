@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum, UniqueConstraint, JSON
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum, UniqueConstraint, Index, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -48,6 +48,10 @@ class NotificationType(str, enum.Enum):
 
 class Workspace(Base):
     __tablename__ = "workspaces"
+    __table_args__ = (
+        # Covering index so name-ordered listings of id/whitelist status are index-only
+        Index('ix_workspaces_name_covering', 'name', postgresql_include=['id', 'is_whitelisted']),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, unique=True)  # Workspace names must be unique
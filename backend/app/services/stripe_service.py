@@ -13,12 +13,15 @@ import stripe
 import logging
 from typing import Dict, Optional, List
 from datetime import datetime
+from types import MappingProxyType
 from ..core.config import settings
+from ..core.stripe_http import configure_stripe_http_client
 
 logger = logging.getLogger(__name__)
 
 # Initialize Stripe
 stripe.api_key = settings.stripe_secret_key
+configure_stripe_http_client()
 
 # Flat-rate pricing configuration
 PLAN_PRICES = {
@@ -53,6 +56,19 @@ PLAN_PRICES = {
 TRIAL_DAYS = 7
 ANNUAL_DISCOUNT = 0.20  # 20% discount for annual billing
 
+# Price IDs resolved once at import, keyed (plan, interval). Read-only, so it is
+# safe to share across request threads without a lock.
+_PLAN_PRICE_IDS = MappingProxyType({
+    (plan, interval): config[key]
+    for plan, config in PLAN_PRICES.items()
+    for interval, key in (("month", "monthly_price_id"), ("year", "annual_price_id"))
+})
+
+
+def _get_price_id(plan: str, interval: str) -> str:
+    """Return the flat-rate price ID for a plan; any interval other than 'year' bills monthly."""
+    return _PLAN_PRICE_IDS[(plan, "year" if interval == "year" else "month")]
+
 
 class StripeService:
     """Service for handling Stripe operations with flat-rate pricing."""
@@ -83,12 +99,11 @@ class StripeService:
             Dict with session_id and checkout URL
         """
         try:
-            plan_config = PLAN_PRICES.get(plan)
-            if not plan_config:
+            if plan not in PLAN_PRICES:
                 raise ValueError(f"Invalid plan: {plan}")
 
             # Get the appropriate price ID based on billing interval
-            price_id = plan_config["annual_price_id"] if interval == "year" else plan_config["monthly_price_id"]
+            price_id = _get_price_id(plan, interval)
 
             # Single line item for flat-rate pricing
             line_items = [{
@@ -178,18 +193,11 @@ class StripeService:
             Updated subscription object
         """
         try:
-            subscription = stripe.Subscription.retrieve(subscription_id)
-            existing_metadata = dict(subscription.get("metadata", {}))
-
-            # With flat-rate pricing, we only update metadata (no price changes)
-            updated_metadata = {
-                **existing_metadata,
-                "staff_count": str(new_staff_count),
-            }
-
+            # With flat-rate pricing, we only update metadata (no price changes).
+            # Stripe merges metadata keys, so the existing ones don't need to be read first.
             updated_subscription = stripe.Subscription.modify(
                 subscription_id,
-                metadata=updated_metadata,
+                metadata={"staff_count": str(new_staff_count)},
             )
 
             logger.info(f"Updated staff count metadata to {new_staff_count} for subscription {subscription_id}")
@@ -219,36 +227,27 @@ class StripeService:
             Updated subscription
         """
         try:
-            plan_config = PLAN_PRICES.get(new_plan)
-            if not plan_config:
+            if new_plan not in PLAN_PRICES:
                 raise ValueError(f"Invalid plan: {new_plan}")
 
             subscription = stripe.Subscription.retrieve(subscription_id)
-            existing_metadata = dict(subscription.get("metadata", {}))
 
             # Get new price ID for flat-rate plan
-            new_price_id = plan_config["annual_price_id"] if current_interval == "year" else plan_config["monthly_price_id"]
+            new_price_id = _get_price_id(new_plan, current_interval)
 
-            # Update subscription items (should only be one item with flat-rate)
+            # Update the first (and should be only) item to the new plan's price
+            # in the same request as the metadata, which Stripe merges into the existing keys
             items = subscription["items"]["data"]
+            item_params = {"items": [{"id": items[0].id, "price": new_price_id}]} if items else {}
 
-            if len(items) > 0:
-                # Update the first (and should be only) item to the new plan's price
-                stripe.SubscriptionItem.modify(
-                    items[0].id,
-                    price=new_price_id,
-                )
-
-            # Update metadata
-            updated_metadata = {
-                **existing_metadata,
-                "plan": new_plan,
-                "staff_count": str(new_staff_count),
-                "sso_included": "true",
-            }
             updated_subscription = stripe.Subscription.modify(
                 subscription_id,
-                metadata=updated_metadata,
+                **item_params,
+                metadata={
+                    "plan": new_plan,
+                    "staff_count": str(new_staff_count),
+                    "sso_included": "true",
+                },
             )
 
             logger.info(f"Changed plan to {new_plan} for subscription {subscription_id} (flat-rate)")
@@ -290,9 +289,11 @@ class StripeService:
             raise
 
     @staticmethod
-    def get_subscription(subscription_id: str) -> stripe.Subscription:
-        """Retrieve a subscription."""
+    def get_subscription(subscription_id: str, expand: Optional[List[str]] = None) -> stripe.Subscription:
+        """Retrieve a subscription, optionally expanding nested objects in the same request."""
         try:
+            if expand:
+                return stripe.Subscription.retrieve(subscription_id, expand=expand)
             return stripe.Subscription.retrieve(subscription_id)
         except stripe.error.StripeError as e:
             logger.error(f"Error retrieving subscription: {str(e)}")
@@ -2,12 +2,12 @@
 Archive old Stripe prices to clean up the customer portal.
 Only keep the three current flat-rate plan prices active.
 """
-import stripe
-import os
-from dotenv import load_dotenv
+from _script_logging import get_logger
+from _stripe_init import init
 
-load_dotenv()
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+stripe = init()
+
+logger = get_logger("archive")
 
 # These are the ONLY price IDs that should remain active
 KEEP_ACTIVE = {
@@ -31,18 +31,18 @@ PRODUCT_DEFAULTS = {
     'prod_TEgEVEWIR1lTfs': 'price_1SODOeLvgOLlfex7GErASLgc',  # Large Enterprise Plan -> $249/month
 }
 
-print("Step 1: Updating default prices on products...")
-print("=" * 60)
+logger.info("Step 1: Updating default prices on products...")
+logger.info("=" * 60)
 
 for product_id, default_price_id in PRODUCT_DEFAULTS.items():
     try:
         stripe.Product.modify(product_id, default_price=default_price_id)
-        print(f"✓ Updated product {product_id} default price to {default_price_id}")
+        logger.info(f"✓ Updated product {product_id} default price to {default_price_id}")
     except Exception as e:
-        print(f"✗ Error updating product {product_id}: {str(e)}")
+        logger.error(f"✗ Error updating product {product_id}: {str(e)}")
 
-print("\nStep 2: Fetching all active Stripe prices...")
-print("=" * 60)
+logger.info("\nStep 2: Fetching all active Stripe prices...")
+logger.info("=" * 60)
 
 # Get all prices
 all_prices = []
@@ -60,10 +60,10 @@ while True:
         break
     starting_after = prices.data[-1].id
 
-print(f"Found {len(all_prices)} total prices\n")
+logger.info(f"Found {len(all_prices)} total prices\n")
 
-print("Step 3: Archiving old prices...")
-print("=" * 60)
+logger.info("Step 3: Archiving old prices...")
+logger.info("=" * 60)
 
 # Archive old prices
 archived_count = 0
@@ -73,26 +73,26 @@ error_count = 0
 for price in all_prices:
     if price.id in KEEP_ACTIVE:
         if price.active:
-            print(f"✓ Keeping active: {price.id} (${price.unit_amount/100} {price.nickname or ''})")
+            logger.info(f"✓ Keeping active: {price.id} (${price.unit_amount/100} {price.nickname or ''})")
             kept_count += 1
         else:
             try:
-                print(f"! Activating: {price.id} (${price.unit_amount/100} {price.nickname or ''})")
+                logger.info(f"! Activating: {price.id} (${price.unit_amount/100} {price.nickname or ''})")
                 stripe.Price.modify(price.id, active=True)
                 kept_count += 1
             except Exception as e:
-                print(f"✗ Error activating {price.id}: {str(e)}")
+                logger.error(f"✗ Error activating {price.id}: {str(e)}")
                 error_count += 1
     else:
         if price.active:
             try:
-                print(f"→ Archiving: {price.id} (${price.unit_amount/100} {price.nickname or ''})")
+                logger.info(f"→ Archiving: {price.id} (${price.unit_amount/100} {price.nickname or ''})")
                 stripe.Price.modify(price.id, active=False)
                 archived_count += 1
             except Exception as e:
-                print(f"✗ Error archiving {price.id}: {str(e)}")
+                logger.error(f"✗ Error archiving {price.id}: {str(e)}")
                 error_count += 1
 
-print("\n" + "=" * 60)
-print(f"Summary: {archived_count} prices archived, {kept_count} kept active, {error_count} errors")
-print("=" * 60)
+logger.info("\n" + "=" * 60)
+logger.info(f"Summary: {archived_count} prices archived, {kept_count} kept active, {error_count} errors")
+logger.info("=" * 60)
@@ -2,12 +2,12 @@
 Archive old Stripe products to clean up the customer portal.
 Only keep the three current flat-rate plan products active.
 """
-import stripe
-import os
-from dotenv import load_dotenv
+from _script_logging import get_logger
+from _stripe_init import init
 
-load_dotenv()
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+stripe = init()
+
+logger = get_logger("archive")
 
 # These are the ONLY product IDs that should remain active
 KEEP_ACTIVE = {
@@ -16,8 +16,8 @@ KEEP_ACTIVE = {
     'prod_TEgEVEWIR1lTfs',  # Large Enterprise Plan
 }
 
-print("Fetching all Stripe products...")
-print("=" * 60)
+logger.info("Fetching all Stripe products...")
+logger.info("=" * 60)
 
 # Get all products
 all_products = []
@@ -35,32 +35,41 @@ while True:
         break
     starting_after = products.data[-1].id
 
-print(f"Found {len(all_products)} total products\n")
+logger.info(f"Found {len(all_products)} total products\n")
 
-print("Archiving old products...")
-print("=" * 60)
+logger.info("Archiving old products...")
+logger.info("=" * 60)
 
 # Archive old products
 archived_count = 0
 kept_count = 0
+error_count = 0
 
 for product in all_products:
     if product.id in KEEP_ACTIVE:
         if product.active:
-            print(f"✓ Keeping active: {product.id} ({product.name})")
+            logger.info(f"✓ Keeping active: {product.id} ({product.name})")
             kept_count += 1
         else:
-            print(f"! Activating: {product.id} ({product.name})")
-            stripe.Product.modify(product.id, active=True)
-            kept_count += 1
+            try:
+                logger.info(f"! Activating: {product.id} ({product.name})")
+                stripe.Product.modify(product.id, active=True)
+                kept_count += 1
+            except Exception as e:
+                logger.error(f"✗ Error activating {product.id}: {str(e)}")
+                error_count += 1
     else:
         if product.active:
-            print(f"→ Archiving: {product.id} ({product.name})")
-            stripe.Product.modify(product.id, active=False)
-            archived_count += 1
+            try:
+                logger.info(f"→ Archiving: {product.id} ({product.name})")
+                stripe.Product.modify(product.id, active=False)
+                archived_count += 1
+            except Exception as e:
+                logger.error(f"✗ Error archiving {product.id}: {str(e)}")
+                error_count += 1
         else:
-            print(f"  Already archived: {product.id} ({product.name})")
+            logger.info(f"  Already archived: {product.id} ({product.name})")
 
-print("\n" + "=" * 60)
-print(f"Summary: {archived_count} products archived, {kept_count} kept active")
-print("=" * 60)
+logger.info("\n" + "=" * 60)
+logger.info(f"Summary: {archived_count} products archived, {kept_count} kept active, {error_count} errors")
+logger.info("=" * 60)
@@ -5,6 +5,12 @@ import stripe
 from app.core.config import settings
 from app.models.database import SessionLocal
 from app.models.models import Workspace
+from _script_logging import get_logger
+
+logger = get_logger("cancel_stripe_subs")
+
+# Subscription statuses that can no longer be canceled
+INACTIVE_STATUSES = {'canceled', 'incomplete_expired'}
 
 def cancel_all_subscriptions():
     """Cancel all Stripe subscriptions in the database."""
@@ -12,51 +18,69 @@ def cancel_all_subscriptions():
     db = SessionLocal()
 
     try:
-        print("=" * 80)
-        print("❌ CANCELING ALL STRIPE SUBSCRIPTIONS")
-        print("=" * 80)
+        logger.info("=" * 80)
+        logger.info("❌ CANCELING ALL STRIPE SUBSCRIPTIONS")
+        logger.info("=" * 80)
 
-        workspaces = db.query(Workspace).filter(
-            Workspace.stripe_subscription_id.isnot(None)
-        ).all()
+        # Subscription ID -> workspace name for every workspace we know about
+        workspace_names = dict(
+            db.query(Workspace.stripe_subscription_id, Workspace.name).filter(
+                Workspace.stripe_subscription_id.isnot(None)
+            ).all()
+        )
 
-        print(f"\nFound {len(workspaces)} workspaces with Stripe subscriptions\n")
+        logger.info(f"\nFound {len(workspace_names)} workspaces with Stripe subscriptions\n")
 
         canceled_count = 0
         failed_count = 0
+        pending = set(workspace_names)
+
+        # Page through Stripe's subscriptions instead of issuing one DELETE per
+        # workspace, so already-terminated subscriptions never cost a request
+        for sub in stripe.Subscription.list(status="all", limit=100).auto_paging_iter():
+            if not pending:
+                break
+            if sub.id not in pending:
+                continue
+            pending.discard(sub.id)
 
-        for ws in workspaces:
-            print(f"🏢 Workspace: {ws.name}")
-            print(f"   Subscription ID: {ws.stripe_subscription_id}")
+            if sub.status in INACTIVE_STATUSES:
+                continue
+
+            logger.info(f"🏢 Workspace: {workspace_names[sub.id]}")
+            logger.info(f"   Subscription ID: {sub.id}")
 
             try:
                 # Cancel the subscription immediately (not at period end)
-                subscription = stripe.Subscription.delete(ws.stripe_subscription_id)
+                subscription = stripe.Subscription.delete(sub.id)
 
                 if subscription.status == 'canceled':
-                    print(f"   ✅ CANCELED SUCCESSFULLY")
+                    logger.info(f"   ✅ CANCELED SUCCESSFULLY")
                     canceled_count += 1
                 else:
-                    print(f"   ⚠️  Status after cancellation: {subscription.status}")
+                    logger.info(f"   ⚠️  Status after cancellation: {subscription.status}")
                     canceled_count += 1
 
             except stripe.error.InvalidRequestError as e:
-                print(f"   ❌ ERROR: {str(e)}")
+                logger.error(f"   ❌ ERROR: {str(e)}")
                 failed_count += 1
             except Exception as e:
-                print(f"   ❌ Unexpected error: {str(e)}")
+                logger.error(f"   ❌ Unexpected error: {str(e)}")
                 failed_count += 1
 
-            print()
+            logger.info("")
+
+        skipped_count = len(workspace_names) - canceled_count - failed_count
 
-        print("=" * 80)
-        print(f"\n📊 Summary:")
-        print(f"   ✅ Successfully canceled: {canceled_count}")
-        print(f"   ❌ Failed: {failed_count}")
-        print("\n" + "=" * 80)
+        logger.info("=" * 80)
+        logger.info(f"\n📊 Summary:")
+        logger.info(f"   ✅ Successfully canceled: {canceled_count}")
+        logger.info(f"   ❌ Failed: {failed_count}")
+        logger.info(f"   ⏭️  Already inactive or not found in Stripe: {skipped_count}")
+        logger.info("\n" + "=" * 80)
 
     except Exception as e:
-        print(f"\n❌ Error canceling subscriptions: {str(e)}")
+        logger.error(f"\n❌ Error canceling subscriptions: {str(e)}")
         raise
     finally:
         db.close()
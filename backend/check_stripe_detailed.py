@@ -1,72 +1,86 @@
 """
 Script to check detailed Stripe subscription status including cancellation flags.
 """
-import stripe
+import sys
 from datetime import datetime
-from app.core.config import settings
+from _stripe_init import SEP, TERMINAL_STATUSES, init, get_client, fetch_subscriptions, workspace_lines
 from app.models.database import SessionLocal
 from app.models.models import Workspace
 
+stripe = init()
+client = get_client()
+
 def check_stripe_subscriptions_detailed():
     """Check the detailed status of all Stripe subscriptions."""
-    stripe.api_key = settings.stripe_secret_key
     db = SessionLocal()
 
     try:
-        print("=" * 80)
+        print(SEP)
         print("💳 DETAILED STRIPE SUBSCRIPTION CHECK")
-        print("=" * 80)
-
-        workspaces = db.query(Workspace).filter(
+        print(SEP)
+
+        # Only the printed columns; rows are read-only tuples, not ORM instances
+        workspaces = db.query(
+            Workspace.name,
+            Workspace.stripe_customer_id,
+            Workspace.stripe_subscription_id,
+            Workspace.plan,
+            Workspace.subscription_status,
+        ).filter(
             Workspace.stripe_subscription_id.isnot(None)
         ).all()
 
         print(f"\nFound {len(workspaces)} workspaces with Stripe subscriptions\n")
 
+        # Subscription ID -> Future for every workspace that needs a Stripe lookup
+        lookups = fetch_subscriptions(client, workspaces)
+
         for ws in workspaces:
-            print(f"🏢 Workspace: {ws.name}")
-            print(f"   Customer ID: {ws.stripe_customer_id}")
-            print(f"   Subscription ID: {ws.stripe_subscription_id}")
+            lines = workspace_lines(ws)
+
+            if ws.subscription_status in TERMINAL_STATUSES:
+                sys.stdout.write("\n".join(lines) + "\n\n")
+                continue
 
             try:
-                # Fetch subscription from Stripe
-                subscription = stripe.Subscription.retrieve(ws.stripe_subscription_id)
+                subscription = lookups[ws.stripe_subscription_id].result()
 
-                print(f"   Status: {subscription.status.upper()}")
-                print(f"   Plan: {ws.plan.value}")
+                lines.append(f"   Status: {subscription.status.upper()}")
+                lines.append(f"   Plan: {ws.plan.value}")
 
                 # Check cancellation details
                 if subscription.cancel_at_period_end:
-                    print(f"   ✅ MARKED FOR CANCELLATION (will cancel at period end)")
+                    lines.append(f"   ✅ MARKED FOR CANCELLATION (will cancel at period end)")
                     if subscription.cancel_at:
                         cancel_date = datetime.fromtimestamp(subscription.cancel_at)
-                        print(f"   Will cancel at: {cancel_date}")
+                        lines.append(f"   Will cancel at: {cancel_date}")
                 elif subscription.canceled_at:
                     canceled_date = datetime.fromtimestamp(subscription.canceled_at)
-                    print(f"   ✅ CANCELLED on: {canceled_date}")
+                    lines.append(f"   ✅ CANCELLED on: {canceled_date}")
                 else:
-                    print(f"   ⚠️  NOT CANCELLED - Still active!")
+                    lines.append(f"   ⚠️  NOT CANCELLED - Still active!")
 
                 # Trial information
                 if subscription.trial_end:
                     trial_end_date = datetime.fromtimestamp(subscription.trial_end)
-                    print(f"   Trial ends: {trial_end_date}")
+                    lines.append(f"   Trial ends: {trial_end_date}")
                     if subscription.cancel_at_period_end:
-                        print(f"   → Subscription will end when trial expires")
+                        lines.append(f"   → Subscription will end when trial expires")
 
                 # Current period
                 if subscription.current_period_end:
                     period_end = datetime.fromtimestamp(subscription.current_period_end)
-                    print(f"   Current period ends: {period_end}")
+                    lines.append(f"   Current period ends: {period_end}")
 
             except stripe.error.InvalidRequestError as e:
-                print(f"   ❌ ERROR: {str(e)}")
+                lines.append(f"   ❌ ERROR: {str(e)}")
             except Exception as e:
-                print(f"   ❌ Unexpected error: {str(e)}")
+                lines.append(f"   ❌ Unexpected error: {str(e)}")
 
-            print()
+            # One write per workspace instead of one per line
+            sys.stdout.write("\n".join(lines) + "\n\n")
 
-        print("=" * 80)
+        print(SEP)
 
     except Exception as e:
         print(f"\n❌ Error checking subscriptions: {str(e)}")
@@ -1,62 +1,75 @@
 """
 Script to check the status of Stripe subscriptions.
 """
-import stripe
-from app.core.config import settings
+import sys
+from datetime import datetime
+from _stripe_init import SEP, TERMINAL_STATUSES, init, get_client, fetch_subscriptions, workspace_lines
 from app.models.database import SessionLocal
 from app.models.models import Workspace
 
+stripe = init()
+client = get_client()
+
 def check_stripe_subscriptions():
     """Check the status of all Stripe subscriptions in the database."""
-    stripe.api_key = settings.stripe_secret_key
     db = SessionLocal()
 
     try:
-        print("=" * 80)
+        print(SEP)
         print("💳 STRIPE SUBSCRIPTION STATUS CHECK")
-        print("=" * 80)
+        print(SEP)
 
-        workspaces = db.query(Workspace).filter(
+        # Only the printed columns; rows are read-only tuples, not ORM instances
+        workspaces = db.query(
+            Workspace.name,
+            Workspace.stripe_customer_id,
+            Workspace.stripe_subscription_id,
+            Workspace.plan,
+            Workspace.subscription_status,
+        ).filter(
             Workspace.stripe_subscription_id.isnot(None)
         ).all()
 
         print(f"\nFound {len(workspaces)} workspaces with Stripe subscriptions\n")
 
+        # Subscription ID -> Future for every workspace that needs a Stripe lookup
+        lookups = fetch_subscriptions(client, workspaces)
+
         for ws in workspaces:
-            print(f"🏢 Workspace: {ws.name}")
-            print(f"   Customer ID: {ws.stripe_customer_id}")
-            print(f"   Subscription ID: {ws.stripe_subscription_id}")
+            lines = workspace_lines(ws)
+
+            if ws.subscription_status in TERMINAL_STATUSES:
+                sys.stdout.write("\n".join(lines) + "\n\n")
+                continue
 
             try:
-                # Fetch subscription from Stripe
-                subscription = stripe.Subscription.retrieve(ws.stripe_subscription_id)
+                subscription = lookups[ws.stripe_subscription_id].result()
 
-                print(f"   Status: {subscription.status.upper()}")
-                print(f"   Plan: {ws.plan.value}")
+                lines.append(f"   Status: {subscription.status.upper()}")
+                lines.append(f"   Plan: {ws.plan.value}")
 
                 if subscription.status == 'canceled':
-                    print(f"   ✅ CANCELED")
+                    lines.append(f"   ✅ CANCELED")
                     if subscription.canceled_at:
-                        from datetime import datetime
                         canceled_date = datetime.fromtimestamp(subscription.canceled_at)
-                        print(f"   Canceled at: {canceled_date}")
+                        lines.append(f"   Canceled at: {canceled_date}")
                 elif subscription.status == 'active':
-                    print(f"   ⚠️  STILL ACTIVE")
+                    lines.append(f"   ⚠️  STILL ACTIVE")
                     if subscription.current_period_end:
-                        from datetime import datetime
                         end_date = datetime.fromtimestamp(subscription.current_period_end)
-                        print(f"   Period ends: {end_date}")
+                        lines.append(f"   Period ends: {end_date}")
                 else:
-                    print(f"   ℹ️  Status: {subscription.status}")
+                    lines.append(f"   ℹ️  Status: {subscription.status}")
 
             except stripe.error.InvalidRequestError as e:
-                print(f"   ❌ ERROR: {str(e)}")
+                lines.append(f"   ❌ ERROR: {str(e)}")
             except Exception as e:
-                print(f"   ❌ Unexpected error: {str(e)}")
+                lines.append(f"   ❌ Unexpected error: {str(e)}")
 
-            print()
+            # One write per workspace instead of one per line
+            sys.stdout.write("\n".join(lines) + "\n\n")
 
-        print("=" * 80)
+        print(SEP)
 
     except Exception as e:
         print(f"\n❌ Error checking subscriptions: {str(e)}")
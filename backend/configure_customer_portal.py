@@ -1,12 +1,9 @@
 """
 Configure Stripe Customer Portal to allow plan switching between the three active plans.
 """
-import stripe
-import os
-from dotenv import load_dotenv
+from _stripe_init import init
 
-load_dotenv()
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+stripe = init()
 
 # The three active products with their prices that should be available for switching
 ACTIVE_PRODUCTS_WITH_PRICES = [
@@ -89,8 +86,11 @@ try:
     print(f"  Available products: {len(ACTIVE_PRODUCTS_WITH_PRICES)}")
     print()
     print("Products configured:")
+    # One list call for all product names instead of a retrieve per product
+    product_ids = [product_config['product'] for product_config in ACTIVE_PRODUCTS_WITH_PRICES]
+    products = {product.id: product for product in stripe.Product.list(ids=product_ids).auto_paging_iter()}
     for product_config in ACTIVE_PRODUCTS_WITH_PRICES:
-        product = stripe.Product.retrieve(product_config['product'])
+        product = products[product_config['product']]
         print(f"  - {product.name} ({product_config['product']})")
         print(f"    Prices: {len(product_config['prices'])} price options")
 
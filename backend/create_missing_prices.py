@@ -1,12 +1,10 @@
 """
 Create missing Stripe prices for updated pricing tiers.
 """
-import stripe
-import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from _stripe_init import init
 
-load_dotenv()
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+stripe = init()
 
 # Product IDs from Stripe
 PRODUCTS = {
@@ -15,6 +13,11 @@ PRODUCTS = {
     'large': 'prod_TEgEVEWIR1lTfs',     # Large Enterprise Plan
 }
 
+# Stripe replays the original response for a repeated idempotency key (kept for 24h),
+# so re-running after a partial failure doesn't create duplicate prices.
+# Bump this when intentionally changing prices to force fresh creates.
+IDEMPOTENCY_VERSION = "v1"
+
 # New prices to create (in cents)
 NEW_PRICES = {
     # Small is unchanged - already has correct prices
@@ -53,9 +56,19 @@ print("=" * 60)
 
 created_prices = {}
 
-for key, price_data in NEW_PRICES.items():
+with ThreadPoolExecutor(max_workers=6) as executor:
+    futures = {
+        key: executor.submit(
+            stripe.Price.create,
+            **price_data,
+            idempotency_key=f"acktrail:price:{key}:{IDEMPOTENCY_VERSION}",
+        )
+        for key, price_data in NEW_PRICES.items()
+    }
+
+for key, future in futures.items():
     try:
-        price = stripe.Price.create(**price_data)
+        price = future.result()
         created_prices[key] = price.id
         print(f"✓ Created {key}: {price.id} (${price.unit_amount/100})")
     except Exception as e:
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""List all files in B2 bucket."""
+"""
+List all files in B2 bucket.
+
+Usage:
+    python list_b2_files.py [prefix]
+"""
 
 import sys
 import os
@@ -8,26 +13,20 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
 from app.core.storage import storage
 
-def list_files():
-    """List all files in the B2 bucket."""
+def list_files(prefix=""):
+    """List all files in the B2 bucket, optionally limited to a folder prefix."""
     print("=" * 60)
     print(f"Files in bucket: {storage.bucket_name}")
+    if prefix:
+        print(f"Prefix: {prefix}")
     print("=" * 60)
+    print()
 
     try:
-        # List all files in the bucket
-        files = list(storage.bucket.ls(recursive=True))
-
-        if not files:
-            print("\n  No files found in bucket")
-            return
-
-        print(f"\nFound {len(files)} files:\n")
-
-        for file_info in files:
-            # file_info is a tuple: (file_version_info, folder_name)
-            file_version = file_info[0]
-
+        # Stream files as B2 pages them in rather than loading the whole listing first;
+        # the prefix is filtered server-side
+        count = 0
+        for file_version, _folder_name in storage.bucket.ls(folder_to_list=prefix, recursive=True):
             file_name = file_version.file_name
             file_size = file_version.size
             content_type = file_version.content_type
@@ -36,6 +35,13 @@ def list_files():
             print(f"    Size: {file_size:,} bytes ({file_size / 1024:.2f} KB)")
             print(f"    Type: {content_type}")
             print()
+            count += 1
+
+        if not count:
+            print("  No files found in bucket")
+            return
+
+        print(f"Found {count} files")
 
     except Exception as e:
         print(f"\nError listing files: {e}")
@@ -44,4 +50,4 @@ def list_files():
 
 
 if __name__ == "__main__":
-    list_files()
+    list_files(sys.argv[1] if len(sys.argv) > 1 else "")
@@ -10,10 +10,11 @@ New model: Flat-rate pricing tiers based on staff count ranges
 Annual pricing: 20% discount (was 15%)
 SSO: Now included in all plans (was $50/month addon)
 """
-import stripe
-from app.core.config import settings
+from concurrent.futures import ThreadPoolExecutor
+from _stripe_init import init
+from _stripe_products import needs_update
 
-stripe.api_key = settings.stripe_secret_key
+stripe = init()
 
 # Product IDs from our current Stripe account
 PRODUCTS = {
@@ -31,6 +32,10 @@ PRODUCTS = {
     }
 }
 
+# Suffix for the Price.create idempotency keys, so a re-run returns the prices
+# created by the first run. Bump it when deliberately re-pricing.
+IDEMPOTENCY_VERSION = "v1"
+
 # New flat-rate pricing
 NEW_PRICING = {
     'small': {
@@ -63,19 +68,15 @@ def create_new_prices():
     print("=" * 70)
     print()
 
-    created_prices = {}
-
-    for plan_id, pricing in NEW_PRICING.items():
-        product_id = PRODUCTS[plan_id]['base']
-
-        print(f"Processing {plan_id.upper()} plan...")
-        print(f"  Product ID: {product_id}")
-        print(f"  Staff range: {pricing['staff_range']}")
-        print()
+    # The six Price.create calls are independent, so issue them concurrently
+    # and report the results per plan in the usual order
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {}
+        for plan_id, pricing in NEW_PRICING.items():
+            product_id = PRODUCTS[plan_id]['base']
 
-        # Create monthly price
-        try:
-            monthly_price = stripe.Price.create(
+            futures[(plan_id, 'monthly')] = executor.submit(
+                stripe.Price.create,
                 product=product_id,
                 unit_amount=pricing['monthly'],
                 currency='usd',
@@ -87,21 +88,11 @@ def create_new_prices():
                     'staff_range': pricing['staff_range'],
                     'pricing_model': 'flat_rate',
                     'sso_included': 'true',
-                }
+                },
+                idempotency_key=f"acktrail:migrate:{plan_id}:month:{IDEMPOTENCY_VERSION}",
             )
-            print(f"  ✅ Created monthly price: {monthly_price.id}")
-            print(f"     Amount: ${pricing['monthly']/100}/month")
-
-            if plan_id not in created_prices:
-                created_prices[plan_id] = {}
-            created_prices[plan_id]['monthly'] = monthly_price.id
-
-        except Exception as e:
-            print(f"  ❌ Error creating monthly price: {str(e)}")
-
-        # Create annual price
-        try:
-            annual_price = stripe.Price.create(
+            futures[(plan_id, 'annual')] = executor.submit(
+                stripe.Price.create,
                 product=product_id,
                 unit_amount=pricing['annual'],
                 currency='usd',
@@ -114,12 +105,38 @@ def create_new_prices():
                     'pricing_model': 'flat_rate',
                     'discount': '20%',
                     'sso_included': 'true',
-                }
+                },
+                idempotency_key=f"acktrail:migrate:{plan_id}:year:{IDEMPOTENCY_VERSION}",
             )
+
+    created_prices = {}
+
+    for plan_id, pricing in NEW_PRICING.items():
+        product_id = PRODUCTS[plan_id]['base']
+
+        print(f"Processing {plan_id.upper()} plan...")
+        print(f"  Product ID: {product_id}")
+        print(f"  Staff range: {pricing['staff_range']}")
+        print()
+
+        # Monthly price
+        try:
+            monthly_price = futures[(plan_id, 'monthly')].result()
+            print(f"  ✅ Created monthly price: {monthly_price.id}")
+            print(f"     Amount: ${pricing['monthly']/100}/month")
+
+            created_prices.setdefault(plan_id, {})['monthly'] = monthly_price.id
+
+        except Exception as e:
+            print(f"  ❌ Error creating monthly price: {str(e)}")
+
+        # Annual price
+        try:
+            annual_price = futures[(plan_id, 'annual')].result()
             print(f"  ✅ Created annual price: {annual_price.id}")
             print(f"     Amount: ${pricing['annual']/100}/year (≈${pricing['annual']/12/100:.2f}/month)")
 
-            created_prices[plan_id]['annual'] = annual_price.id
+            created_prices.setdefault(plan_id, {})['annual'] = annual_price.id
 
         except Exception as e:
             print(f"  ❌ Error creating annual price: {str(e)}")
@@ -128,36 +145,60 @@ def create_new_prices():
 
     return created_prices
 
-def update_product_metadata():
+def fetch_products():
+    """Fetch every product this migration touches with a single list call."""
+    product_ids = [pid for products in PRODUCTS.values() for pid in products.values()]
+    return {
+        product.id: product
+        for product in stripe.Product.list(ids=product_ids, limit=100).auto_paging_iter()
+    }
+
+def update_product_metadata(products):
     """Update product descriptions and metadata."""
     print("=" * 70)
     print("Updating Product Metadata")
     print("=" * 70)
     print()
 
+    updates = {}
     for plan_id, pricing in NEW_PRICING.items():
         product_id = PRODUCTS[plan_id]['base']
+        desired = {
+            'name': pricing['name'],
+            'description': pricing['description'],
+            'metadata': {
+                'plan_type': plan_id,
+                'pricing_model': 'flat_rate',
+                'staff_range': pricing['staff_range'],
+                'sso_included': 'true',
+                'annual_discount': '20%',
+            },
+        }
+
+        if needs_update(products.get(product_id), desired):
+            updates[plan_id] = (product_id, desired)
+
+    # Issue the modifies concurrently, then report in plan order
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            plan_id: executor.submit(stripe.Product.modify, product_id, **desired)
+            for plan_id, (product_id, desired) in updates.items()
+        }
+
+    for plan_id in NEW_PRICING:
+        if plan_id not in futures:
+            print(f"⏭️  {plan_id.upper()} product metadata already up to date")
+            continue
 
         try:
-            stripe.Product.modify(
-                product_id,
-                name=pricing['name'],
-                description=pricing['description'],
-                metadata={
-                    'plan_type': plan_id,
-                    'pricing_model': 'flat_rate',
-                    'staff_range': pricing['staff_range'],
-                    'sso_included': 'true',
-                    'annual_discount': '20%',
-                }
-            )
+            futures[plan_id].result()
             print(f"✅ Updated {plan_id.upper()} product metadata")
         except Exception as e:
             print(f"❌ Error updating {plan_id.upper()}: {str(e)}")
 
     print()
 
-def archive_per_staff_products():
+def archive_per_staff_products(products):
     """Archive the old per-staff products (don't delete, just archive)."""
     print("=" * 70)
     print("Archiving Old Per-Staff Products")
@@ -167,19 +208,31 @@ def archive_per_staff_products():
     print("Existing subscriptions will continue to work.")
     print()
 
-    for plan_id, products in PRODUCTS.items():
-        per_staff_id = products['per_staff']
+    desired = {
+        'active': False,
+        'metadata': {
+            'archived': 'true',
+            'archived_date': '2025-01-25',
+            'reason': 'Migrated to flat-rate pricing model',
+        },
+    }
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            plan_id: executor.submit(stripe.Product.modify, plan_products['per_staff'], **desired)
+            for plan_id, plan_products in PRODUCTS.items()
+            if needs_update(products.get(plan_products['per_staff']), desired)
+        }
+
+    for plan_id, plan_products in PRODUCTS.items():
+        per_staff_id = plan_products['per_staff']
+
+        if plan_id not in futures:
+            print(f"⏭️  {plan_id.upper()} per-staff product already archived ({per_staff_id})")
+            continue
 
         try:
-            stripe.Product.modify(
-                per_staff_id,
-                active=False,
-                metadata={
-                    'archived': 'true',
-                    'archived_date': '2025-01-25',
-                    'reason': 'Migrated to flat-rate pricing model',
-                }
-            )
+            futures[plan_id].result()
             print(f"✅ Archived {plan_id.upper()} per-staff product ({per_staff_id})")
         except Exception as e:
             print(f"❌ Error archiving {plan_id.upper()}: {str(e)}")
@@ -208,11 +261,14 @@ def main():
     # Create new prices
     created_prices = create_new_prices()
 
+    # Read current product state once so unchanged products are skipped
+    products = fetch_products()
+
     # Update product metadata
-    update_product_metadata()
+    update_product_metadata(products)
 
     # Archive per-staff products
-    archive_per_staff_products()
+    archive_per_staff_products(products)
 
     # Summary
     print("=" * 70)
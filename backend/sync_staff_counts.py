@@ -12,73 +12,82 @@ import os
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from collections import defaultdict
+from sqlalchemy import Integer, bindparam, column, func, update, values
 from app.models.database import SessionLocal
 from app.models.models import Workspace, User, UserRole
-from uuid import UUID
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def update_workspace_active_staff_count(db, workspace_id: UUID) -> int:
-    """
-    Calculate and update the active staff count for a workspace.
-    Active staff = employees only (role=employee, is_guest=False, active=True).
-    Admins do NOT count towards the seat limit.
-    """
-    # Count only active employees (not admins, not guests)
-    active_staff = db.query(User).filter(
-        User.workspace_id == workspace_id,
-        User.role == UserRole.EMPLOYEE,
-        User.is_guest == False,
-        User.active == True
-    ).count()
-
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-    if workspace:
-        old_count = workspace.active_staff_count
-        workspace.active_staff_count = active_staff
-        db.commit()
-        logger.info(f"Workspace '{workspace.name}': {old_count} -> {active_staff} active staff")
-        return active_staff
-
-    return 0
-
-
 def main():
     """Sync active_staff_count for all workspaces."""
     db = SessionLocal()
 
     try:
-        workspaces = db.query(Workspace).all()
-        logger.info(f"Found {len(workspaces)} workspaces to sync")
-
-        total_synced = 0
+        total = db.query(func.count(Workspace.id)).scalar()
+        logger.info(f"Found {total} workspaces to sync")
+
+        # One grouped query for every workspace's active user counts.
+        # Active staff = employees only (role=employee, is_guest=False, active=True).
+        # Admins do NOT count towards the seat limit.
+        counts = defaultdict(lambda: {'staff': 0, 'admins': 0})
+        rows = db.query(
+            User.workspace_id, User.role, User.is_guest, func.count(User.id)
+        ).filter(
+            User.active == True
+        ).group_by(User.workspace_id, User.role, User.is_guest).all()
+        for workspace_id, role, is_guest, count in rows:
+            if role == UserRole.ADMIN:
+                counts[workspace_id]['admins'] += count
+            elif not is_guest:
+                counts[workspace_id]['staff'] += count
+
+        # Stream plain rows in batches and report the pre-update counts as we go,
+        # so memory stays flat however many workspaces there are
+        workspaces = db.query(
+            Workspace.id, Workspace.name, Workspace.staff_count, Workspace.active_staff_count
+        ).yield_per(500)
+        changed = []
         for workspace in workspaces:
-            try:
-                active_count = update_workspace_active_staff_count(db, workspace.id)
-                total_synced += 1
-
-                # Log summary for each workspace
-                admin_count = db.query(User).filter(
-                    User.workspace_id == workspace.id,
-                    User.role == UserRole.ADMIN,
-                    User.active == True
-                ).count()
-
-                logger.info(
-                    f"  - {workspace.name}: "
-                    f"Licensed={workspace.staff_count or 0}, "
-                    f"Active={active_count}, "
-                    f"Admins={admin_count}"
-                )
-
-            except Exception as e:
-                logger.error(f"Error syncing workspace {workspace.id}: {str(e)}")
-                continue
-
-        logger.info(f"\n✅ Successfully synced {total_synced}/{len(workspaces)} workspaces")
+            ws_counts = counts[workspace.id]
+            if workspace.active_staff_count != ws_counts['staff']:
+                changed.append((workspace.id, ws_counts['staff']))
+            logger.info(
+                f"  - {workspace.name}: "
+                f"{workspace.active_staff_count} -> {ws_counts['staff']} active staff, "
+                f"Licensed={workspace.staff_count or 0}, "
+                f"Admins={ws_counts['admins']}"
+            )
+
+        # One UPDATE ... FROM (VALUES ...) over just the changed rows and a single
+        # commit, skipped entirely when every stored count is already correct
+        if changed:
+            if db.get_bind().dialect.name == "postgresql":
+                new_counts = values(
+                    column('id', Workspace.id.type), column('cnt', Integer), name='v'
+                ).data(changed)
+                stmt = update(Workspace.__table__).where(
+                    Workspace.id == new_counts.c.id,
+                    # No-op for rows that already hold the count by the time we write
+                    Workspace.active_staff_count.is_distinct_from(new_counts.c.cnt)
+                ).values(active_staff_count=new_counts.c.cnt)
+                db.execute(stmt)
+            else:
+                # SQLite can't alias VALUES columns; the local fallback writes row by row
+                stmt = update(Workspace.__table__).where(
+                    Workspace.id == bindparam('_id'),
+                    Workspace.active_staff_count.is_distinct_from(bindparam('cnt'))
+                ).values(active_staff_count=bindparam('cnt'))
+                db.execute(stmt, [{'_id': ws_id, 'cnt': cnt} for ws_id, cnt in changed])
+            db.commit()
+
+        logger.info(
+            f"\n✅ Successfully synced {total}/{total} workspaces "
+            f"({len(changed)} updated)"
+        )
 
     except Exception as e:
         logger.error(f"Error in main sync: {str(e)}")
@@ -9,31 +9,43 @@ Example:
     python sync_stripe.py "Acktrail"
 """
 
+import re
 import sys
 from uuid import UUID
+from sqlalchemy import or_
 from app.models.database import SessionLocal
 from app.models.models import Workspace, PlanTier
 from app.services.stripe_service import StripeService
 
 
+_UUID_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE
+)
+
+# Substring in a lower-cased product name -> plan tier value
+PLAN_KEYWORDS = (("small", "small"), ("medium", "medium"), ("large", "large"))
+
+
 def is_valid_uuid(value):
-    """Check if a string is a valid UUID."""
-    try:
-        UUID(value)
-        return True
-    except (ValueError, AttributeError):
-        return False
+    """Check if a string is a UUID in canonical hyphenated form."""
+    return bool(_UUID_RE.fullmatch(value))
 
 
 def sync_workspace_from_stripe(workspace_identifier):
     """Sync workspace data from Stripe."""
     db = SessionLocal()
     try:
-        # Find workspace by ID or name
+        # Find workspace by ID or name in one query; a UUID-shaped name still matches,
+        # and an ID match wins if both do
+        query = db.query(Workspace)
         if is_valid_uuid(workspace_identifier):
-            workspace = db.query(Workspace).filter(Workspace.id == UUID(workspace_identifier)).first()
+            workspace_id = UUID(workspace_identifier)
+            query = query.filter(
+                or_(Workspace.id == workspace_id, Workspace.name == workspace_identifier)
+            ).order_by((Workspace.id == workspace_id).desc())
         else:
-            workspace = db.query(Workspace).filter(Workspace.name == workspace_identifier).first()
+            query = query.filter(Workspace.name == workspace_identifier)
+        workspace = query.first()
 
         if not workspace:
             print(f"❌ Error: Workspace '{workspace_identifier}' not found")
@@ -43,47 +55,47 @@ def sync_workspace_from_stripe(workspace_identifier):
             print(f"❌ Error: Workspace '{workspace.name}' has no Stripe subscription")
             return False
 
-        print(f"\n📋 Workspace: {workspace.name}")
-        print(f"   ID: {workspace.id}")
-        print()
+        sys.stdout.write(f"\n📋 Workspace: {workspace.name}\n   ID: {workspace.id}\n\n")
 
-        # Get subscription from Stripe
-        subscription = StripeService.get_subscription(workspace.stripe_subscription_id)
+        # Get subscription from Stripe, with each item's product expanded inline
+        subscription = StripeService.get_subscription(
+            workspace.stripe_subscription_id,
+            expand=["items.data.price.product"]
+        )
 
-        print("Current Database Values:")
-        print(f"  Plan: {workspace.plan.value}")
-        print(f"  Staff Count: {workspace.staff_count}")
-        print(f"  Subscription Status: {workspace.subscription_status}")
-        print(f"  Billing Interval: {workspace.billing_interval}")
-        print()
+        sys.stdout.write("\n".join([
+            "Current Database Values:",
+            f"  Plan: {workspace.plan.value}",
+            f"  Staff Count: {workspace.staff_count}",
+            f"  Subscription Status: {workspace.subscription_status}",
+            f"  Billing Interval: {workspace.billing_interval}",
+        ]) + "\n\n")
 
         # Parse subscription items to determine plan and staff count
-        import stripe
         plan_name = None
         staff_count = None
 
         for item in subscription["items"]["data"]:
-            price = stripe.Price.retrieve(item.price.id)
-            product = stripe.Product.retrieve(price.product)
+            product_name = item.price.product.name.casefold()
 
-            if "Small" in product.name:
-                plan_name = "small"
-            elif "Medium" in product.name:
-                plan_name = "medium"
-            elif "Large" in product.name:
-                plan_name = "large"
+            plan_name = next(
+                (plan for keyword, plan in PLAN_KEYWORDS if keyword in product_name),
+                plan_name
+            )
 
-            if "Per Staff" in product.name:
+            if "per staff" in product_name:
                 staff_count = item.quantity
 
-        print("Stripe Subscription Values:")
-        print(f"  Subscription ID: {subscription.id}")
-        print(f"  Status: {subscription.status}")
+        lines = [
+            "Stripe Subscription Values:",
+            f"  Subscription ID: {subscription.id}",
+            f"  Status: {subscription.status}",
+        ]
         if plan_name:
-            print(f"  Plan: {plan_name}")
+            lines.append(f"  Plan: {plan_name}")
         if staff_count:
-            print(f"  Staff Count: {staff_count}")
-        print()
+            lines.append(f"  Staff Count: {staff_count}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
         # Confirm update
         if plan_name or staff_count:
@@ -102,12 +114,14 @@ def sync_workspace_from_stripe(workspace_identifier):
 
             db.commit()
 
-            print()
-            print("✅ Success: Workspace synced with Stripe")
-            print("\nUpdated Database Values:")
-            print(f"  Plan: {workspace.plan.value}")
-            print(f"  Staff Count: {workspace.staff_count}")
-            print(f"  Subscription Status: {workspace.subscription_status}")
+            sys.stdout.write("\n".join([
+                "",
+                "✅ Success: Workspace synced with Stripe",
+                "\nUpdated Database Values:",
+                f"  Plan: {workspace.plan.value}",
+                f"  Staff Count: {workspace.staff_count}",
+                f"  Subscription Status: {workspace.subscription_status}",
+            ]) + "\n")
 
             return True
         else:
@@ -11,6 +11,15 @@ from app.models.database import SessionLocal
 from app.models.models import User
 from app.core.security import create_jwt_token
 
+
+def read_pdf_stream(response):
+    """Consume a streamed response, returning (size, is_pdf) without buffering the whole body."""
+    chunks = response.iter_content(chunk_size=65536)
+    first = next(chunks, b'')
+    size = len(first) + sum(len(chunk) for chunk in chunks)
+    return size, first.startswith(b'%PDF')
+
+
 def test_pdf_endpoint():
     """Test the PDF proxy endpoint with authentication."""
     print("=" * 60)
@@ -41,64 +50,66 @@ def test_pdf_endpoint():
         "Authorization": f"Bearer {token}"
     }
 
-    print(f"\n[1/2] Testing PDF proxy endpoint...")
-    print(f"  URL: {url}")
-
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-
-        print(f"  Status Code: {response.status_code}")
-
-        if response.status_code == 200:
-            print(f"  ✓ PDF downloaded successfully!")
-            print(f"    Content-Type: {response.headers.get('Content-Type')}")
-            print(f"    Content-Length: {len(response.content):,} bytes ({len(response.content) / 1024:.2f} KB)")
-
-            # Verify it's a PDF
-            if response.content.startswith(b'%PDF'):
-                print(f"    ✓ Content is a valid PDF")
-            else:
-                print(f"    ✗ Content does not appear to be a PDF")
-                return False
-
-        else:
-            print(f"  ✗ Request failed!")
-            print(f"    Response: {response.text}")
+    # One keep-alive session so the second request reuses the connection
+    with requests.Session() as session:
+        print(f"\n[1/2] Testing PDF proxy endpoint...")
+        print(f"  URL: {url}")
+
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=30) as response:
+                print(f"  Status Code: {response.status_code}")
+
+                if response.status_code == 200:
+                    size, is_pdf = read_pdf_stream(response)
+                    print(f"  ✓ PDF downloaded successfully!")
+                    print(f"    Content-Type: {response.headers.get('Content-Type')}")
+                    print(f"    Content-Length: {size:,} bytes ({size / 1024:.2f} KB)")
+
+                    # Verify it's a PDF
+                    if is_pdf:
+                        print(f"    ✓ Content is a valid PDF")
+                    else:
+                        print(f"    ✗ Content does not appear to be a PDF")
+                        return False
+
+                else:
+                    print(f"  ✗ Request failed!")
+                    print(f"    Response: {response.text}")
+                    return False
+
+        except Exception as e:
+            print(f"  ✗ Request error: {e}")
             return False
 
-    except Exception as e:
-        print(f"  ✗ Request error: {e}")
-        return False
-
-    # Test with query parameter token (for "Open in New Tab")
-    print(f"\n[2/2] Testing with query parameter token...")
-    url_with_token = f"{url}?token={token}"
-    print(f"  URL: {url_with_token}")
-
-    try:
-        response = requests.get(url_with_token, timeout=30)
-
-        print(f"  Status Code: {response.status_code}")
-
-        if response.status_code == 200:
-            print(f"  ✓ PDF downloaded successfully with query token!")
-            print(f"    Content-Length: {len(response.content):,} bytes")
-
-            if response.content.startswith(b'%PDF'):
-                print(f"    ✓ Content is a valid PDF")
-            else:
-                print(f"    ✗ Content does not appear to be a PDF")
-                return False
-
-        else:
-            print(f"  ✗ Request failed!")
-            print(f"    Response: {response.text}")
+        # Test with query parameter token (for "Open in New Tab")
+        print(f"\n[2/2] Testing with query parameter token...")
+        url_with_token = f"{url}?token={token}"
+        print(f"  URL: {url_with_token}")
+
+        try:
+            with session.get(url_with_token, stream=True, timeout=30) as response:
+                print(f"  Status Code: {response.status_code}")
+
+                if response.status_code == 200:
+                    size, is_pdf = read_pdf_stream(response)
+                    print(f"  ✓ PDF downloaded successfully with query token!")
+                    print(f"    Content-Length: {size:,} bytes")
+
+                    if is_pdf:
+                        print(f"    ✓ Content is a valid PDF")
+                    else:
+                        print(f"    ✗ Content does not appear to be a PDF")
+                        return False
+
+                else:
+                    print(f"  ✗ Request failed!")
+                    print(f"    Response: {response.text}")
+                    return False
+
+        except Exception as e:
+            print(f"  ✗ Request error: {e}")
             return False
 
-    except Exception as e:
-        print(f"  ✗ Request error: {e}")
-        return False
-
     print(f"\n{'=' * 60}")
     print(f"✓ All PDF Proxy API Tests Passed!")
     print(f"{'=' * 60}")
@@ -3,6 +3,7 @@
 
 import sys
 import os
+import hashlib
 
 # Add backend directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
@@ -45,10 +46,16 @@ def test_b2_connection():
         print(f"\n[2/3] Testing file download...")
         downloaded_content = storage.download_file(file_key)
 
-        if downloaded_content == test_content:
+        expected_digest = hashlib.sha256(test_content).hexdigest()
+        downloaded_digest = hashlib.sha256(downloaded_content).hexdigest()
+
+        if downloaded_digest == expected_digest:
             print(f"  ✓ Download successful! Content matches.")
+            print(f"    SHA-256: {downloaded_digest}")
         else:
             print(f"  ✗ Download failed! Content mismatch.")
+            print(f"    Expected SHA-256: {expected_digest} ({len(test_content)} bytes)")
+            print(f"    Got SHA-256:      {downloaded_digest} ({len(downloaded_content)} bytes)")
             return False
 
         # Test file info
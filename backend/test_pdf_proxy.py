@@ -4,6 +4,7 @@
 import sys
 import os
 from urllib.parse import unquote
+from uuid import UUID
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
@@ -11,6 +12,24 @@ from app.models.database import SessionLocal
 from app.models.models import Policy
 from app.core.storage import download_policy_file
 
+
+def check_pdf_content(file_content):
+    """Print the size of downloaded content and return whether it is a PDF.
+
+    Works on a memoryview, so bytes, bytearray and BytesIO.getbuffer() are all
+    inspected without copying.
+    """
+    buf = memoryview(file_content)
+    print(f"    File size: {buf.nbytes:,} bytes ({buf.nbytes / 1024:.2f} KB)")
+
+    if buf[:4] == b'%PDF':
+        print(f"  ✓ File is a valid PDF")
+        return True
+
+    print(f"  ✗ File does not appear to be a PDF")
+    return False
+
+
 def test_pdf_proxy():
     """Test PDF proxy for a specific policy."""
     print("=" * 60)
@@ -22,7 +41,7 @@ def test_pdf_proxy():
     try:
         # Get the policy
         policy_id = "ab50f812-688d-4ce9-9521-399a1d9d1965"
-        policy = db.query(Policy).filter(Policy.id == policy_id).first()
+        policy = db.get(Policy, UUID(policy_id))
 
         if not policy:
             print(f"\n✗ Policy {policy_id} not found")
@@ -59,13 +78,9 @@ def test_pdf_proxy():
             # Try with URL decoded key
             file_content = download_policy_file(file_key_decoded)
             print(f"  ✓ Download successful with decoded key!")
-            print(f"    File size: {len(file_content):,} bytes ({len(file_content) / 1024:.2f} KB)")
 
             # Verify it's a valid PDF
-            if file_content.startswith(b'%PDF'):
-                print(f"  ✓ File is a valid PDF")
-            else:
-                print(f"  ✗ File does not appear to be a PDF")
+            if not check_pdf_content(file_content):
                 return False
 
         except Exception as e:
@@ -75,12 +90,8 @@ def test_pdf_proxy():
             try:
                 file_content = download_policy_file(file_key)
                 print(f"  ✓ Download successful with encoded key!")
-                print(f"    File size: {len(file_content):,} bytes ({len(file_content) / 1024:.2f} KB)")
 
-                if file_content.startswith(b'%PDF'):
-                    print(f"  ✓ File is a valid PDF")
-                else:
-                    print(f"  ✗ File does not appear to be a PDF")
+                if not check_pdf_content(file_content):
                     return False
 
             except Exception as e2:
@@ -1,12 +1,10 @@
 """
 Update price nicknames to clearly show the 20% annual discount.
 """
-import stripe
-import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from _stripe_init import init
 
-load_dotenv()
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+stripe = init()
 
 # Price updates with clearer discount messaging
 PRICE_UPDATES = {
@@ -38,9 +36,15 @@ PRICE_UPDATES = {
 print("Updating price nicknames to show 20% annual discount...")
 print("=" * 60)
 
+with ThreadPoolExecutor(max_workers=6) as executor:
+    futures = {
+        price_id: executor.submit(stripe.Price.modify, price_id, **updates)
+        for price_id, updates in PRICE_UPDATES.items()
+    }
+
 for price_id, updates in PRICE_UPDATES.items():
     try:
-        stripe.Price.modify(price_id, **updates)
+        futures[price_id].result()
         print(f"✓ Updated {price_id}")
         print(f"  New nickname: {updates['nickname']}")
     except Exception as e:
@@ -1,12 +1,11 @@
 """
 Update product descriptions to match the marketing copy from plans.js
 """
-import stripe
-import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from _stripe_init import init
+from _stripe_products import needs_update
 
-load_dotenv()
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+stripe = init()
 
 # Product updates matching plans.js marketing copy
 PRODUCT_UPDATES = {
@@ -21,13 +20,31 @@ PRODUCT_UPDATES = {
     },
 }
 
+
 print("Updating product descriptions...")
 print("=" * 60)
 
+# Fetch current descriptions in one call and only modify products that differ
+current = {
+    product.id: product
+    for product in stripe.Product.list(ids=list(PRODUCT_UPDATES), limit=100).auto_paging_iter()
+}
+
+with ThreadPoolExecutor(max_workers=6) as executor:
+    futures = {
+        product_id: executor.submit(stripe.Product.modify, product_id, **updates)
+        for product_id, updates in PRODUCT_UPDATES.items()
+        if needs_update(current.get(product_id), updates)
+    }
+
 for product_id, updates in PRODUCT_UPDATES.items():
+    if product_id not in futures:
+        print(f"- Skipped {current[product_id].name} ({product_id}): already up to date")
+        continue
+
     try:
-        product = stripe.Product.retrieve(product_id)
-        stripe.Product.modify(product_id, **updates)
+        # modify returns the updated product, so its name comes back without a retrieve
+        product = futures[product_id].result()
         print(f"✓ Updated {product.name} ({product_id})")
         print(f"  New description: {updates['description'][:80]}...")
     except Exception as e:
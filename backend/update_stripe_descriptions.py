@@ -2,10 +2,12 @@
 Update Stripe product descriptions with new benefit-focused messaging.
 This updates the 6 active products currently in use.
 """
-import stripe
-from app.core.config import settings
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from _stripe_init import init
+from _stripe_products import needs_update
 
-stripe.api_key = settings.stripe_secret_key
+stripe = init()
 
 # Define the 6 active product IDs and their new descriptions
 PRODUCT_UPDATES = {
@@ -70,47 +72,74 @@ PRODUCT_UPDATES = {
 
 def update_product_descriptions():
     """Update product descriptions in Stripe."""
-    print("=" * 70)
-    print("Updating Stripe Product Descriptions")
-    print("=" * 70)
-    print()
+    sys.stdout.write("=" * 70 + "\nUpdating Stripe Product Descriptions\n" + "=" * 70 + "\n\n")
 
     updated_count = 0
 
-    for product_id, updates in PRODUCT_UPDATES.items():
-        try:
-            # Get current product
-            product = stripe.Product.retrieve(product_id)
-
-            print(f"Updating: {product.name}")
-            print(f"  ID: {product_id}")
-            print(f"  New description: {updates['description'][:80]}...")
+    # One list call for the current state, so unchanged products are never modified
+    current = {
+        product.id: product
+        for product in stripe.Product.list(ids=list(PRODUCT_UPDATES), limit=100).auto_paging_iter()
+    }
 
-            # Update product
-            stripe.Product.modify(
+    # Products are independent, so update them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            product_id: executor.submit(
+                stripe.Product.modify,
                 product_id,
                 description=updates['description'],
                 metadata=updates['metadata']
             )
+            for product_id, updates in PRODUCT_UPDATES.items()
+            if needs_update(current.get(product_id), updates)
+        }
 
-            print(f"  ✅ Updated successfully\n")
+    # One write per product and one for the summary, instead of a print per line
+    for product_id, updates in PRODUCT_UPDATES.items():
+        if product_id not in futures:
+            sys.stdout.write(
+                f"Skipping: {current[product_id].name}\n"
+                f"  ID: {product_id}\n"
+                f"  ⏭️  Already up to date\n\n"
+            )
+            continue
+
+        try:
+            # modify returns the updated product, so no separate retrieve is needed for its name
+            product = futures[product_id].result()
+
+            lines = [
+                f"Updating: {product.name}",
+                f"  ID: {product_id}",
+                f"  New description: {updates['description'][:80]}...",
+                f"  ✅ Updated successfully",
+            ]
             updated_count += 1
 
         except Exception as e:
-            print(f"  ❌ Error: {str(e)}\n")
+            lines = [
+                f"Updating: {product_id}",
+                f"  ❌ Error: {str(e)}",
+            ]
 
-    print("=" * 70)
-    print(f"Complete! Updated {updated_count}/{len(PRODUCT_UPDATES)} products")
-    print("=" * 70)
-    print()
-    print("✅ Product descriptions now match your new positioning:")
-    print("   - Focus on stopping email chaos")
-    print("   - Emphasize time savings (3 hours → 10 minutes)")
-    print("   - Highlight specific use cases (onboarding, training)")
-    print()
-    print("🔗 View in Stripe Dashboard:")
-    print("   https://dashboard.stripe.com/products")
-    print()
+        sys.stdout.write("\n".join(lines) + "\n\n")
+
+    sys.stdout.write("\n".join([
+        "=" * 70,
+        f"Complete! Updated {updated_count}/{len(PRODUCT_UPDATES)} products "
+        f"({len(PRODUCT_UPDATES) - len(futures)} already up to date)",
+        "=" * 70,
+        "",
+        "✅ Product descriptions now match your new positioning:",
+        "   - Focus on stopping email chaos",
+        "   - Emphasize time savings (3 hours → 10 minutes)",
+        "   - Highlight specific use cases (onboarding, training)",
+        "",
+        "🔗 View in Stripe Dashboard:",
+        "   https://dashboard.stripe.com/products",
+        "",
+    ]) + "\n")
 
 if __name__ == "__main__":
     print()
@@ -2,10 +2,10 @@
 Script to update Stripe product descriptions with new messaging.
 Run this to update product descriptions in Stripe to match our new positioning.
 """
-import stripe
-from app.core.config import settings
+from concurrent.futures import ThreadPoolExecutor
+from _stripe_init import init
 
-stripe.api_key = settings.stripe_secret_key
+stripe = init()
 
 def update_stripe_products():
     """Update Stripe product descriptions with benefit-focused messaging."""
@@ -47,10 +47,11 @@ def update_stripe_products():
 
     print("Updating Stripe products...\n")
 
+    # Determine which plan each product is, then run the modifies concurrently
+    plan_types = {}
     for product in products.data:
         product_name = product.name.lower()
 
-        # Determine which plan this is
         plan_type = None
         if "small" in product_name:
             plan_type = "small"
@@ -58,20 +59,29 @@ def update_stripe_products():
             plan_type = "medium"
         elif "large" in product_name:
             plan_type = "large"
+        plan_types[product.id] = plan_type
 
-        if plan_type and plan_type in product_updates:
-            updates = product_updates[plan_type]
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            product_id: executor.submit(
+                stripe.Product.modify,
+                product_id,
+                description=product_updates[plan_type]['description'],
+                metadata=product_updates[plan_type]['metadata']
+            )
+            for product_id, plan_type in plan_types.items()
+            if plan_type in product_updates
+        }
+
+    for product in products.data:
+        if product.id in futures:
+            updates = product_updates[plan_types[product.id]]
 
             print(f"Updating {product.name}...")
             print(f"  New description: {updates['description'][:100]}...")
 
-            # Update product
-            stripe.Product.modify(
-                product.id,
-                description=updates['description'],
-                metadata=updates['metadata']
-            )
-
+            # Every modify has already run by now; a failure re-raises here and cuts the report short
+            futures[product.id].result()
             print(f"  ✅ Updated successfully\n")
         else:
             print(f"Skipping {product.name} (not a plan product)\n")
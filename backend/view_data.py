@@ -1,107 +1,166 @@
 """
 Script to view all data in the database before cleanup.
 """
+import sys
+from sqlalchemy import func, select
 from app.models.database import SessionLocal
 from app.models.models import (
     Workspace, User, Team, Policy, Assignment,
     Acknowledgment, EmailEvent, AuthCode, Notification
 )
 
+SEP = "-" * 80
+
+# Per-record templates, each filled with one str.format call per row
+WORKSPACE_TEMPLATE = (
+    "  ID: {}\n"
+    "  Name: {}\n"
+    "  Plan: {}\n"
+    "  Staff Count: {}\n"
+    "  Users: {}\n"
+    "  Teams: {}\n"
+    "  SSO Enabled: {}\n"
+    "  Created: {}\n"
+)
+STRIPE_CUSTOMER_TEMPLATE = "  Stripe Customer: {}\n"
+STRIPE_SUBSCRIPTION_TEMPLATE = "  Stripe Subscription: {}\n"
+USER_TEMPLATE = (
+    "  ID: {}\n"
+    "  Email: {}\n"
+    "  Name: {}\n"
+    "  Role: {}\n"
+    "  Workspace: {}\n"
+    "  Is Guest: {}\n"
+    "  Can Login: {}\n"
+    "  Active: {}\n"
+    "  Platform Admin: {}\n"
+)
+TEAM_TEMPLATE = "  ID: {}\n  Name: {}\n  Workspace: {}\n"
+POLICY_TEMPLATE = "  ID: {}\n  Title: {}\n  Version: {}\n  Due: {}\n"
+ASSIGNMENT_TEMPLATE = "  ID: {}\n  Status: {}\n"
+
+
+def write_section(title, count, rows, format_row, empty_message=None):
+    """
+    Write a section header, then stream rows and write each as one block.
+
+    format_row turns a row into its text block. An empty section never
+    executes rows; its empty_message, if any, is written instead.
+    """
+    sys.stdout.write(f"\n{title} ({count}):\n{SEP}\n")
+    if not count:
+        if empty_message:
+            sys.stdout.write(f"  {empty_message}\n")
+        return
+    for row in rows.yield_per(200):
+        sys.stdout.write(format_row(row) + "\n")
+
+
 def view_all_data():
     """Display all data from the database."""
     db = SessionLocal()
 
     try:
-        print("=" * 80)
-        print("📊 DATABASE CONTENTS")
-        print("=" * 80)
-
-        # Workspaces
-        workspaces = db.query(Workspace).all()
-        print(f"\n🏢 WORKSPACES ({len(workspaces)}):")
-        print("-" * 80)
-        for ws in workspaces:
-            print(f"  ID: {ws.id}")
-            print(f"  Name: {ws.name}")
-            print(f"  Plan: {ws.plan}")
-            print(f"  Staff Count: {ws.staff_count}")
-            print(f"  SSO Enabled: {ws.sso_enabled}")
-            print(f"  Created: {ws.created_at}")
+        if db.get_bind().dialect.name == "postgresql":
+            # One read-only snapshot for every count and listing below; DEFERRABLE
+            # waits for a safe snapshot instead of tracking serialization conflicts
+            db.connection(execution_options={
+                "isolation_level": "SERIALIZABLE",
+                "postgresql_readonly": True,
+                "postgresql_deferrable": True,
+            })
+
+        sys.stdout.write("=" * 80 + "\n📊 DATABASE CONTENTS\n" + "=" * 80 + "\n")
+
+        # Every section's total in one round trip, so the listings can stream
+        (
+            workspace_count, user_count, team_count, policy_count,
+            assignment_count, auth_code_count, notification_count
+        ) = db.query(*(
+            select(func.count()).select_from(model).scalar_subquery()
+            for model in (Workspace, User, Team, Policy, Assignment, AuthCode, Notification)
+        )).one()
+
+        # Listings select only the printed columns, as plain rows rather than ORM objects.
+        # Each row is formatted from its template and written as one block.
+        workspace_names = {}
+
+        # Per-workspace member totals, aggregated in the database up front
+        user_counts = dict(
+            db.query(User.workspace_id, func.count(User.id)).group_by(User.workspace_id).all()
+        )
+        team_counts = dict(
+            db.query(Team.workspace_id, func.count(Team.id)).group_by(Team.workspace_id).all()
+        )
+
+        def format_workspace(ws):
+            # Collected as the workspaces stream, for the users and teams sections
+            workspace_names[ws.id] = ws.name
+            block = WORKSPACE_TEMPLATE.format(
+                ws.id, ws.name, ws.plan, ws.staff_count,
+                user_counts.get(ws.id, 0), team_counts.get(ws.id, 0),
+                ws.sso_enabled, ws.created_at
+            )
             if ws.stripe_customer_id:
-                print(f"  Stripe Customer: {ws.stripe_customer_id}")
+                block += STRIPE_CUSTOMER_TEMPLATE.format(ws.stripe_customer_id)
             if ws.stripe_subscription_id:
-                print(f"  Stripe Subscription: {ws.stripe_subscription_id}")
-            print()
-
-        # Users
-        users = db.query(User).all()
-        print(f"\n👥 USERS ({len(users)}):")
-        print("-" * 80)
-        for user in users:
-            ws = db.query(Workspace).filter(Workspace.id == user.workspace_id).first()
-            print(f"  ID: {user.id}")
-            print(f"  Email: {user.email}")
-            print(f"  Name: {user.name}")
-            print(f"  Role: {user.role}")
-            print(f"  Workspace: {ws.name if ws else 'N/A'}")
-            print(f"  Is Guest: {user.is_guest}")
-            print(f"  Can Login: {user.can_login}")
-            print(f"  Active: {user.active}")
-            print(f"  Platform Admin: {user.is_platform_admin}")
-            print()
-
-        # Teams
-        teams = db.query(Team).all()
-        print(f"\n👨‍👩‍👧‍👦 TEAMS ({len(teams)}):")
-        print("-" * 80)
-        if teams:
-            for team in teams:
-                ws = db.query(Workspace).filter(Workspace.id == team.workspace_id).first()
-                print(f"  ID: {team.id}")
-                print(f"  Name: {team.name}")
-                print(f"  Workspace: {ws.name if ws else 'N/A'}")
-                print()
-        else:
-            print("  No teams found")
-
-        # Policies
-        policies = db.query(Policy).all()
-        print(f"\n📄 POLICIES ({len(policies)}):")
-        print("-" * 80)
-        if policies:
-            for policy in policies:
-                print(f"  ID: {policy.id}")
-                print(f"  Title: {policy.title}")
-                print(f"  Status: {policy.status}")
-                print()
-        else:
-            print("  No policies found")
-
-        # Assignments
-        assignments = db.query(Assignment).all()
-        print(f"\n📋 ASSIGNMENTS ({len(assignments)}):")
-        print("-" * 80)
-        if assignments:
-            for assignment in assignments:
-                print(f"  ID: {assignment.id}")
-                print(f"  Status: {assignment.status}")
-                print()
-        else:
-            print("  No assignments found")
-
-        # Auth codes
-        auth_codes = db.query(AuthCode).all()
-        print(f"\n🔑 AUTH CODES ({len(auth_codes)}):")
-        print("-" * 80)
-        print(f"  Total: {len(auth_codes)}")
-
-        # Notifications
-        notifications = db.query(Notification).all()
-        print(f"\n🔔 NOTIFICATIONS ({len(notifications)}):")
-        print("-" * 80)
-        print(f"  Total: {len(notifications)}")
-
-        print("\n" + "=" * 80)
+                block += STRIPE_SUBSCRIPTION_TEMPLATE.format(ws.stripe_subscription_id)
+            return block
+
+        write_section(
+            "🏢 WORKSPACES", workspace_count,
+            db.query(
+                Workspace.id, Workspace.name, Workspace.plan, Workspace.staff_count,
+                Workspace.sso_enabled, Workspace.created_at,
+                Workspace.stripe_customer_id, Workspace.stripe_subscription_id
+            ),
+            format_workspace
+        )
+
+        write_section(
+            "👥 USERS", user_count,
+            db.query(
+                User.id, User.email, User.name, User.role, User.workspace_id,
+                User.is_guest, User.can_login, User.active, User.is_platform_admin
+            ),
+            lambda user: USER_TEMPLATE.format(
+                user.id, user.email, user.name, user.role,
+                workspace_names.get(user.workspace_id, 'N/A'),
+                user.is_guest, user.can_login, user.active, user.is_platform_admin
+            )
+        )
+
+        write_section(
+            "👨‍👩‍👧‍👦 TEAMS", team_count,
+            db.query(Team.id, Team.name, Team.workspace_id),
+            lambda team: TEAM_TEMPLATE.format(
+                team.id, team.name, workspace_names.get(team.workspace_id, 'N/A')
+            ),
+            empty_message="No teams found"
+        )
+
+        write_section(
+            "📄 POLICIES", policy_count,
+            db.query(Policy.id, Policy.title, Policy.version, Policy.due_at),
+            lambda policy: POLICY_TEMPLATE.format(
+                policy.id, policy.title, policy.version, policy.due_at or 'N/A'
+            ),
+            empty_message="No policies found"
+        )
+
+        write_section(
+            "📋 ASSIGNMENTS", assignment_count,
+            db.query(Assignment.id, Assignment.status),
+            lambda assignment: ASSIGNMENT_TEMPLATE.format(assignment.id, assignment.status),
+            empty_message="No assignments found"
+        )
+
+        # Auth codes and notifications
+        sys.stdout.write(
+            f"\n🔑 AUTH CODES ({auth_code_count}):\n{SEP}\n  Total: {auth_code_count}\n"
+            f"\n🔔 NOTIFICATIONS ({notification_count}):\n{SEP}\n  Total: {notification_count}\n"
+            f"\n{'=' * 80}\n"
+        )
 
     except Exception as e:
         print(f"\n❌ Error viewing data: {str(e)}")
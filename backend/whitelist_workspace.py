@@ -3,7 +3,7 @@
 Script to whitelist a workspace so it bypasses payment requirements.
 
 Usage:
-    python whitelist_workspace.py <workspace_name_or_id> [--unwhitelist]
+    python whitelist_workspace.py <workspace_name_or_id> [<workspace_name_or_id> ...] [--unwhitelist]
 
 Examples:
     # Whitelist a workspace by name
@@ -12,61 +12,122 @@ Examples:
     # Whitelist a workspace by ID
     python whitelist_workspace.py "550e8400-e29b-41d4-a716-446655440000"
 
+    # Whitelist several workspaces at once
+    python whitelist_workspace.py "My Company" "Other Company"
+
     # Remove a workspace from whitelist
     python whitelist_workspace.py "My Company" --unwhitelist
+
+    # Keep one process and database session open and read identifiers from stdin,
+    # one command per line (same arguments as above; quote names with spaces)
+    python whitelist_workspace.py --interactive
 """
 
+import shlex
 import sys
 from uuid import UUID
+from sqlalchemy import func, or_, update
 from app.models.database import SessionLocal
 from app.models.models import Workspace
 
+# Cap on how many workspaces the not-found hint lists
+AVAILABLE_WORKSPACES_LIMIT = 50
+
 
-def is_valid_uuid(value):
-    """Check if a string is a valid UUID."""
+def parse_uuid(value):
+    """Parse a string as a UUID, returning None if it isn't one."""
     try:
-        UUID(value)
-        return True
+        return UUID(value)
     except (ValueError, AttributeError):
-        return False
-
-
-def whitelist_workspace(workspace_identifier, unwhitelist=False):
-    """Whitelist or unwhitelist a workspace."""
-    db = SessionLocal()
+        return None
+
+
+def print_available_workspaces(db):
+    """List workspaces by name as a hint after a failed lookup."""
+    print("\nAvailable workspaces:")
+    total = db.query(func.count(Workspace.id)).scalar()
+    workspaces = db.query(
+        Workspace.name, Workspace.id, Workspace.is_whitelisted
+    ).order_by(Workspace.name).limit(AVAILABLE_WORKSPACES_LIMIT).all()
+    for ws in workspaces:
+        whitelist_status = "✓ Whitelisted" if ws.is_whitelisted else "✗ Not whitelisted"
+        print(f"  - {ws.name} (ID: {ws.id}) [{whitelist_status}]")
+    if total > len(workspaces):
+        print(f"  ... and {total - len(workspaces)} more")
+
+
+def whitelist_workspace(workspace_identifiers, unwhitelist=False, db=None):
+    """
+    Whitelist or unwhitelist one or more workspaces.
+
+    All identifiers are resolved and updated in a single statement. If any of
+    them doesn't match a workspace, nothing is changed. Pass db to reuse an
+    open session; otherwise one is created and closed here.
+    """
+    if isinstance(workspace_identifiers, str):
+        workspace_identifiers = [workspace_identifiers]
+
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
     try:
-        # Try to find workspace by ID or name
-        if is_valid_uuid(workspace_identifier):
-            workspace = db.query(Workspace).filter(Workspace.id == UUID(workspace_identifier)).first()
-        else:
-            workspace = db.query(Workspace).filter(Workspace.name == workspace_identifier).first()
-
-        if not workspace:
-            print(f"❌ Error: Workspace '{workspace_identifier}' not found")
-            print("\nAvailable workspaces:")
-            workspaces = db.query(Workspace).all()
-            for ws in workspaces:
-                whitelist_status = "✓ Whitelisted" if ws.is_whitelisted else "✗ Not whitelisted"
-                print(f"  - {ws.name} (ID: {ws.id}) [{whitelist_status}]")
+        # Split identifiers into IDs and names, parsing each UUID once
+        uuid_vals = {}
+        names = []
+        for identifier in workspace_identifiers:
+            uuid_val = parse_uuid(identifier)
+            if uuid_val is not None:
+                uuid_vals[identifier] = uuid_val
+            else:
+                names.append(identifier)
+
+        # Find the workspaces by ID or name and update their whitelist status in one
+        # statement, returning the fields shown below
+        workspaces = db.execute(
+            update(Workspace)
+            .where(or_(Workspace.id.in_(list(uuid_vals.values())), Workspace.name.in_(names)))
+            .values(is_whitelisted=not unwhitelist)
+            .returning(
+                Workspace.id, Workspace.name, Workspace.plan,
+                Workspace.staff_count, Workspace.is_whitelisted
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+
+        # IDs are UUID objects and names are strings, so one set can hold both
+        found = {ws.id for ws in workspaces} | {ws.name for ws in workspaces}
+        missing = [
+            identifier for identifier in workspace_identifiers
+            if uuid_vals.get(identifier, identifier) not in found
+        ]
+
+        if missing:
+            db.rollback()
+            for identifier in missing:
+                print(f"❌ Error: Workspace '{identifier}' not found")
+            if workspaces:
+                print("No workspaces were changed.")
+            print_available_workspaces(db)
             return False
 
-        # Update whitelist status
-        workspace.is_whitelisted = not unwhitelist
         db.commit()
 
         action = "removed from whitelist" if unwhitelist else "whitelisted"
-        print(f"✅ Success: Workspace '{workspace.name}' has been {action}")
-        print(f"\nWorkspace Details:")
-        print(f"  - Name: {workspace.name}")
-        print(f"  - ID: {workspace.id}")
-        print(f"  - Plan: {workspace.plan.value}")
-        print(f"  - Whitelisted: {workspace.is_whitelisted}")
-        print(f"  - Staff Count: {workspace.staff_count}")
-
-        if workspace.is_whitelisted:
-            print("\n💡 This workspace will now bypass all payment requirements during signup.")
+        for workspace in workspaces:
+            print(f"✅ Success: Workspace '{workspace.name}' has been {action}")
+            print(f"\nWorkspace Details:")
+            print(f"  - Name: {workspace.name}")
+            print(f"  - ID: {workspace.id}")
+            print(f"  - Plan: {workspace.plan.value}")
+            print(f"  - Whitelisted: {workspace.is_whitelisted}")
+            print(f"  - Staff Count: {workspace.staff_count}")
+            print()
+
+        subject = "These workspaces" if len(workspaces) > 1 else "This workspace"
+        if unwhitelist:
+            print(f"💡 {subject} will now require payment during signup.")
         else:
-            print("\n💡 This workspace will now require payment during signup.")
+            print(f"💡 {subject} will now bypass all payment requirements during signup.")
 
         return True
 
@@ -74,19 +135,60 @@ def whitelist_workspace(workspace_identifier, unwhitelist=False):
         print(f"❌ Error: {str(e)}")
         db.rollback()
         return False
+    finally:
+        if owns_session:
+            db.close()
+
+
+def parse_args(args):
+    """Split command arguments into workspace identifiers and the unwhitelist flag."""
+    identifiers = [arg for arg in args if arg != "--unwhitelist"]
+    return identifiers, "--unwhitelist" in args
+
+
+def run_interactive():
+    """Read whitelist commands from stdin, reusing one session for all of them."""
+    db = SessionLocal()
+    failures = 0
+    try:
+        print("Enter workspace names or IDs (add --unwhitelist to remove); blank line or Ctrl-D to quit.")
+        while True:
+            try:
+                line = input("whitelist> ").strip()
+            except EOFError:
+                break
+            if not line:
+                break
+
+            try:
+                identifiers, unwhitelist = parse_args(shlex.split(line))
+            except ValueError as e:
+                print(f"❌ Error: {str(e)}")
+                failures += 1
+                continue
+            if not identifiers:
+                continue
+
+            if not whitelist_workspace(identifiers, unwhitelist, db=db):
+                failures += 1
+            print()
     finally:
         db.close()
 
+    return failures == 0
+
 
 def main():
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    if "--interactive" in args:
+        sys.exit(0 if run_interactive() else 1)
+
+    workspace_identifiers, unwhitelist = parse_args(args)
+    if not workspace_identifiers:
         print(__doc__)
         sys.exit(1)
 
-    workspace_identifier = sys.argv[1]
-    unwhitelist = "--unwhitelist" in sys.argv
-
-    success = whitelist_workspace(workspace_identifier, unwhitelist)
+    success = whitelist_workspace(workspace_identifiers, unwhitelist)
     sys.exit(0 if success else 1)
 
 